@@ -15,6 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import array
+import sys
+
 # This is commonly called "xmodem CRC16"
 CRC_POLY_CCITT = 0x1021
 CRC_POLY_IBM_REV = 0xA001
@@ -44,8 +47,56 @@ def crc16_xmodem(data: bytes):
     return crc16(data, CRC_POLY_CCITT)
 
 
+def _crc16_reverse_table(poly):
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ poly
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_IBM_REV_TABLE = _crc16_reverse_table(CRC_POLY_IBM_REV)
+
+
+_CRC16_IBM_REV_WORD_TABLE = None
+_CRC16_WORD_THRESHOLD = 64
+
+
+def _crc16_ibm_rev_word_table():
+    """Build (once) the 65536-entry table that consumes two bytes per step"""
+    global _CRC16_IBM_REV_WORD_TABLE
+    if _CRC16_IBM_REV_WORD_TABLE is None:
+        table = _CRC16_IBM_REV_TABLE
+        _CRC16_IBM_REV_WORD_TABLE = tuple(
+            (table[lo] >> 8) ^ table[(table[lo] ^ hi) & 0xFF]
+            for hi in range(256) for lo in range(256))
+    return _CRC16_IBM_REV_WORD_TABLE
+
+
 def crc16_ibm_rev(data):
-    return crc16(data, CRC_POLY_IBM_REV, reverse=True)
+    """Table-driven equivalent of crc16(data, CRC_POLY_IBM_REV, True)"""
+    table = _CRC16_IBM_REV_TABLE
+    crc = 0x0
+    length = len(data)
+    if length >= _CRC16_WORD_THRESHOLD:
+        # Slice-by-2: the register is only 16 bits wide, so a little-endian
+        # word can be folded in and resolved with a single lookup.
+        even = length & ~1
+        words = array.array('H', bytes(data[:even]))
+        if sys.byteorder == 'big':
+            words.byteswap()
+        word_table = _crc16_ibm_rev_word_table()
+        for word in words:
+            crc = word_table[crc ^ word]
+        data = data[even:]
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
 
 
 def checksum_8bit(data, modulo=256):
@@ -14,10 +14,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import bisect
+import functools
 import struct
+import string
 import logging
 import math
 import time
+from collections import namedtuple
 from enum import Enum
 
 from chirp import memmap, chirp_common, bitwise, directory, errors
@@ -36,6 +40,12 @@ LOG = logging.getLogger(__name__)
 
 SERIAL_TIMEOUT = 1.0
 
+# Little-endian 16-bit header fields (payload length, packet index/count)
+_U16 = struct.Struct("<H")
+# magic, payload length + 6, data type, data code, packet index, packet count
+_PACKET_HEADER = struct.Struct("<12sHBBHH")
+_PACKET_MAGIC = b"RDTP\x01\x00\x00\x00\x00\x00\x00\x00"
+
 
 MEM_DEFINITIONS = """
 struct radioinfo {
@@ -327,49 +337,119 @@ class HandshakeStatuses(Enum):
     NoResponse = 5
 
 
+# An entry of the opts lists used for list settings
+Opt = namedtuple("Opt", ["name", "id"])
+
+
+def build_opts_lookup(items):
+    """Names, id -> index and name -> id maps of an opts list"""
+    index_by_id = {}
+    id_by_name = {}
+    for index, item in enumerate(items):
+        index_by_id.setdefault(int(item.id), index)
+        id_by_name.setdefault(item.name, item.id)
+    return tuple(x.name for x in items), index_by_id, id_by_name
+
+
+class OptList(list):
+    """An opts list that is never changed, with its lookup maps built once"""
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.lookup = build_opts_lookup(self)
+
+
 DTMFCHARSET = "0123456789ABCDabcd#*"
 NAMECHARSET = chirp_common.CHARSET_ALPHANUMERIC + "-/;,._!? *#@$%&+=/<>~(){}]'"
+VALID_CHARS = chirp_common.CHARSET_UPPER_NUMERIC + "".join(
+    c for c in "-/;,._!? *#@$%&+=/<>~(){}]'"
+    if c not in chirp_common.CHARSET_UPPER_NUMERIC)
+# Membership sets for filter()
+DTMF_CHARS = frozenset(DTMFCHARSET)
+NAME_CHARS = frozenset(NAMECHARSET)
+# Field lengths of the DTMF code settings
+DTMF_CODE_LENGTHS = {"callid": 10, "stunid": 10, "revive": 10,
+                     "bot": 16, "eot": 16}
+VFOSCAN_FREQ_FIELDS = frozenset(("vhffreq_start", "vhffreq_end"))
+EMPTY_CHANNEL = b"\x00" * 40
 SPECIAL_MEMORIES = {"VFOA": -2, "VFOB": -1}
+VALID_SPECIAL_CHANS = sorted(SPECIAL_MEMORIES.keys())
+VALID_TMODES = ["", "Tone", "TSQL", "DTCS", "Cross"]
+VALID_CROSS_MODES = [
+    "Tone->Tone",
+    "Tone->DTCS",
+    "DTCS->Tone",
+    "->Tone",
+    "->DTCS",
+    "DTCS->",
+    "DTCS->DTCS"]
 MODES = ["NFM", "FM", "AM"]
+# Immutable fields of the preset channels (1-30), some with a fixed mode too
+FIXED_IMMUTABLE = ("empty", "freq", "duplex", "offset")
+FIXED_BAND_IMMUTABLE = FIXED_IMMUTABLE + ("mode", "power")
 POWER_LEVELS = [
     chirp_common.PowerLevel("Low", watts=5),
     chirp_common.PowerLevel("High", watts=50)]
-TIMEOUTTIMER_LIST = [{"name": "%ss" % (x * 5), "id": x}
-                     for x in range(1, 64, 1)]
+TIMEOUTTIMER_LIST = OptList([Opt("%ss" % (x * 5), x) for x in range(1, 64, 1)])
+TIMEOUTTIMER_NAMES = [x.name for x in TIMEOUTTIMER_LIST]
+# Raw CTCSS field value (tenths of Hz) to tone
+RAW_CTC_TONES = {int(round(t * 10)): t for t in chirp_common.TONES}
 TOTPERMISSIONS_LIST = ["Always", "CTCSS/DCS Match",
                        "Channel Free", "Receive Only"]
 SQUELCHLEVEL_LIST = ["AlwaysOpen", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
 AUTOSCAN_LIST = ["OFF", "Auto Scan System"]
 OFFLINE_REVERSAL_LIST = ["OFF", "Freq Reversal", "Talk Around"]
-SIDE_KEY_LIST = [
-    {"name": "OFF", "id": 0},
-    {"name": "TX Power", "id": 1},
-    {"name": "Scan", "id": 2},
-    {"name": "FM Radio", "id": 3},
-    {"name": "Talkaround/Reversal", "id": 5},
-    {"name": "Monitor", "id": 15},
-    {"name": "Zone Plus", "id": 20},
-    {"name": "Zone Minus", "id": 21},
-    {"name": "Squelch", "id": 28},
-    {"name": "Emergency Start", "id": 29},
-    {"name": "Emergency Stop", "id": 30},
-    {"name": "Optional DTMF Code", "id": 32},
-    {"name": "Prog PTT", "id": 31}]
-FREQ_STEP_List = [
-    {"name": "2.5kHz", "id": 2500},
-    {"name": "5kHz", "id": 5000},
-    {"name": "6.25kHz", "id": 6250},
-    {"name": "8.33kHz", "id": 8330},
-    {"name": "10kHz", "id": 10000},
-    {"name": "12.5kHz", "id": 12500},
-    {"name": "25kHz", "id": 25000}]
+SIDE_KEY_LIST = OptList([
+    Opt("OFF", 0),
+    Opt("TX Power", 1),
+    Opt("Scan", 2),
+    Opt("FM Radio", 3),
+    Opt("Talkaround/Reversal", 5),
+    Opt("Monitor", 15),
+    Opt("Zone Plus", 20),
+    Opt("Zone Minus", 21),
+    Opt("Squelch", 28),
+    Opt("Emergency Start", 29),
+    Opt("Emergency Stop", 30),
+    Opt("Optional DTMF Code", 32),
+    Opt("Prog PTT", 31)])
+AUTORESETTIME_LIST = ["OFF"] + ["%ss" % x for x in range(1, 16, 1)]
+DTMF_STUNMODE_LIST = OptList([Opt("Stun TX", 1), Opt("Stun TX/RX", 2)])
+CODEDELAYTIME_LIST = ["300ms", "550ms", "800ms", "1050ms"]
+PTTIDTYPE_LIST = ["OFF", "BOT", "EOT", "Both"]
+VFOSCANMODE_LIST = ["Carrier", "Time", "Search"]
+SCANCONDITION_LIST = ["Carrier", "CTC/DCS"]
+HANGTIME_LIST = ["%s" % (x + 1) for x in range(0, 16, 1)]
+STARTCONDITION_LIST = ["Current Frequency", "Starting Frequency"]
+BAND_SELECTION_LIST = [
+    "Band A", "Band B", "Band A & Band B", "Band B & Band A"]
+# (homeindex, homeselect) written for each band selection
+BAND_SELECTION_VALUES = dict(zip(BAND_SELECTION_LIST,
+                                 [(0, 1), (1, 2), (0, 3), (1, 3)]))
+CALLTONE_LIST = OptList([Opt("%s" % (x + 1), x) for x in range(0, 10, 1)])
+POWERSAVINGDELAYTIME_LIST = OptList(
+    Opt("%ss" % ((x + 1) * 5), x) for x in range(0, 16, 1))
+LEVEL_LIST = OptList([Opt("%s" % x, x) for x in range(1, 16, 1)])
+VOXDELAYTIME_LIST = OptList(
+    [Opt("%sms" % ((x) * 500), x) for x in range(1, 5, 1)])
+MENUOUTTIME_LIST = OptList([Opt("OFF", 0)] + [
+    Opt("%ss" % x, x) for x in range(5, 256, 5)])
+NOAA_CH_LIST = ["NOAA-%s" % x for x in range(1, 13, 1)]
+FREQ_STEP_List = OptList([
+    Opt("2.5kHz", 2500),
+    Opt("5kHz", 5000),
+    Opt("6.25kHz", 6250),
+    Opt("8.33kHz", 8330),
+    Opt("10kHz", 10000),
+    Opt("12.5kHz", 12500),
+    Opt("25kHz", 25000)])
 
 
 class HA1GBank(chirp_common.NamedBank):
 
     def get_name(self):
         _bank = self._model._radio._memobj.zoneinfo.zones[self.index]
-        name = "".join(filter(_bank.name, NAMECHARSET, 14))
+        name = decode_field(_bank.name, NAME_CHARS, 14)
         return name.rstrip()
 
     def set_name(self, name):
@@ -399,30 +479,39 @@ class HA1GBankModel(chirp_common.BankModel):
         return bank_mappings
 
     def get_used_zone_index(self):
-        return [x for x in
-                self.zinfo.zoneindex[0:self.zinfo.zonenum] if x != 0xFFFF]
+        zinfo = self.zinfo
+        return [x for x in get_ul16_array(self._radio, zinfo.zoneindex,
+                                          zinfo.zonenum) if x != 0xFFFF]
+
+    def _get_bank_channels(self):
+        """Channel numbers of every enabled bank, cached on the radio"""
+        radio = self._radio
+        if radio._zone_cache is None:
+            zones = self.zinfo.zones
+            offset = radio._skip_vfoch_count - 1
+            bank_channels = {}
+            for index in self.get_used_zone_index():
+                if index >= len(zones):
+                    continue
+                chindex = get_ul16_array(radio, zones[index].chindex)
+                numbers = (ch - offset for ch in chindex if ch != 0xFFFF)
+                bank_channels[int(index)] = {n for n in numbers if n > 0}
+            radio._zone_cache = bank_channels
+        return radio._zone_cache
 
     def _get_channel_numbers_in_bank(self, bank):
-        if bank.index not in self.get_used_zone_index():
-            return set()
-
-        _members = self.zinfo.zones[bank.index]
-        return set([int(ch) - self._radio._skip_vfoch_count + 1
-                    for ch in _members.chindex if ch != 0xFFFF
-                    and int(ch) - self._radio._skip_vfoch_count + 1 > 0])
+        return set(self._get_bank_channels().get(bank.index, ()))
 
     def _update_bank_with_channel_numbers(self, bank, channels_in_bank):
+        self._radio._zone_cache = None
         _members = self.zinfo.zones[bank.index]
         if len(channels_in_bank) > len(_members.chindex):
             raise Exception("Too many entries in bank %d" % bank.index)
 
-        empty = 0
-        for index, channel_number in enumerate(sorted(channels_in_bank)):
-            _members.chindex[index] = (
-                channel_number + self._radio._skip_vfoch_count - 1)
-            empty = index + 1
-        for index in range(empty, len(_members.chindex)):
-            _members.chindex[index] = 0xFFFF
+        offset = self._radio._skip_vfoch_count - 1
+        set_ul16_array(self._radio, _members.chindex,
+                       [channel_number + offset
+                        for channel_number in sorted(channels_in_bank)])
 
         _members.chnum = len(channels_in_bank)
 
@@ -435,6 +524,7 @@ class HA1GBankModel(chirp_common.BankModel):
         if bank.index not in self.get_used_zone_index():
             self.zinfo.zoneindex[self.zinfo.zonenum] = bank.index
             self.zinfo.zonenum += 1
+            self._radio._zone_cache = None
 
     def remove_memory_from_mapping(self, memory, bank):
         channels_in_bank = self._get_channel_numbers_in_bank(bank)
@@ -445,19 +535,18 @@ class HA1GBankModel(chirp_common.BankModel):
                             (memory.number, bank))
         self._update_bank_with_channel_numbers(bank, channels_in_bank)
 
-        if not channels_in_bank and bank.index in self.get_used_zone_index():
+        used_zone_index = self.get_used_zone_index()
+        if not channels_in_bank and bank.index in used_zone_index:
             # disable bank
             settings = self._radio._memobj.settings
             if settings.homepoweronzone_1 == bank.index:
                 settings.homepoweronzone_1 = 0xFFF
             if settings.homepoweronzone_2 == bank.index:
                 settings.homepoweronzone_2 = 0xFFF
-            _zone_index = [x for x in self.get_used_zone_index()
-                           if x != bank.index]
-            self.zinfo.zoneindex = (
-                _zone_index + [0xFFFF] * (
-                    len(self.zinfo.zoneindex) - len(_zone_index)))
+            _zone_index = [x for x in used_zone_index if x != bank.index]
+            set_ul16_array(self._radio, self.zinfo.zoneindex, _zone_index)
             self.zinfo.zonenum -= 1
+            self._radio._zone_cache = None
 
     def get_mapping_memories(self, bank):
         memories = []
@@ -468,8 +557,9 @@ class HA1GBankModel(chirp_common.BankModel):
 
     def get_memory_mappings(self, memory):
         banks = []
+        bank_channels = self._get_bank_channels()
         for bank in self.get_mappings():
-            if memory.number in self._get_channel_numbers_in_bank(bank):
+            if memory.number in bank_channels.get(bank.index, ()):
                 banks.append(bank)
 
         return banks
@@ -527,10 +617,10 @@ def handshake(self, serial):
     databytes = b""
     max_retries = 15
     retry_delay = 0.05
+    handshake_bytes = get_handshake_bytes(self._model_bytes + b" ")
     for num in range(max_retries):
         flag, databytes = exchange_block_with_radio(
-            get_handshake_bytes(self.current_model + " "),
-            serial, self.read_packet_len)
+            handshake_bytes, serial, self.read_packet_len)
         time.sleep(retry_delay)
         if flag:
             break
@@ -540,15 +630,13 @@ def handshake(self, serial):
 
 
 def validate_connection_handshake(self, dataByte: bytes):
-    success_status = b"\x00\x01"
     pwd_faild_flag = 1
-    if dataByte[14:16] != success_status:
+    # Status bytes [14:16] must read 00 01
+    if len(dataByte) < 16 or dataByte[14] != 0 or dataByte[15] != 1:
         return HandshakeStatuses.Wrong
     if dataByte[20] == pwd_faild_flag:
         return HandshakeStatuses.PwdWrong
-    radioType = dataByte[20: 20 + len(self.current_model)]
-    model_bytes = self.current_model.encode("ascii")
-    if radioType == model_bytes:
+    if dataByte.startswith(self._model_bytes, 20):
         return HandshakeStatuses.Normal
     else:
         return HandshakeStatuses.RadioWrong
@@ -567,7 +655,7 @@ def exchange_block_with_radio(
 def validate_packet(current_packet_Byte: bytes, chunk_size=1024):
     byteLen = len(current_packet_Byte)
     if byteLen <= 13:
-        LOG.debug(f"Packet too short: {byteLen} bytes")
+        LOG.debug("Packet too short: %i bytes", byteLen)
         return False
     """
     I noticed Retevis has another model
@@ -583,31 +671,34 @@ def validate_packet(current_packet_Byte: bytes, chunk_size=1024):
      before it even gets to the CRC calculation - should give us a nice
      performance boost!
     """
-    data_len = (current_packet_Byte[12] - 6
-                if current_packet_Byte[12] > 6 else 0)
-    data_len += current_packet_Byte[13] * packet_count
-    if byteLen - 17 < data_len:
-        LOG.debug(f"Packet too short: {byteLen} bytes")
+    header_len, = _U16.unpack_from(current_packet_Byte, 12)
+    data_len = (max((header_len & 0xFF) - 6, 0)
+                + (header_len >> 8) * packet_count)
+    if byteLen < data_len + 17:
+        LOG.debug("Packet too short: %i bytes", byteLen)
         return False
-    crcBytes = current_packet_Byte[-3:-1]
-    crcStr = calculate_crc16(current_packet_Byte[:-3])
-    return crcBytes == crcStr
+    crc, = _U16.unpack_from(current_packet_Byte, byteLen - 3)
+    return crc == checksum.crc16_ibm_rev(
+        memoryview(current_packet_Byte)[:-3])
 
 
-def get_handshake_bytes(currentModel):
+@functools.lru_cache(maxsize=None)
+def get_handshake_bytes(model_bytes: bytes):
     handshake_flag = 0
     send_packet_index = 0
     send_packet_count = 1
     data_code = 0   # 0-write
     return get_send_packet_bytes(
         handshake_flag, send_packet_index, data_code, send_packet_count,
-        currentModel.encode("ascii").ljust(41, b'\x00'))
+        model_bytes.ljust(41, b'\x00'))
 
 
-def get_read_current_packet_bytes(self, item: int, serial, status):
+def read_item_packets(self, item: int, serial, status):
+    """
+    Request a region from the radio, yielding each packet payload
+    """
     packet_count = 1
     packet_index = 0
-    item_bytes = b""
     send_packet_index = 0
     send_packet_count = 1
     data_code = 2   # 0-write 2-read
@@ -615,18 +706,21 @@ def get_read_current_packet_bytes(self, item: int, serial, status):
         flag, new_data_bytes = exchange_block_with_radio(
                 get_send_packet_bytes(item, send_packet_index,
                                       data_code, send_packet_count,
-                                      struct.pack("<H", packet_index)),
+                                      _U16.pack(packet_index)),
                 serial, self.read_packet_len)
         if (not flag
            or (len(new_data_bytes) > 14 and new_data_bytes[14] != item)):
             raise errors.RadioError("radio reported failure")
         if packet_index == 0:
-            packet_count, = struct.unpack("<H", new_data_bytes[18:20])
+            packet_count, = _U16.unpack_from(new_data_bytes, 18)
         status.cur += len(new_data_bytes)
         self.status_fn(status)
-        item_bytes += new_data_bytes[20:-3]
+        yield memoryview(new_data_bytes)[20:-3]
         packet_index += 1
-    return item_bytes
+
+
+def get_read_current_packet_bytes(self, item: int, serial, status):
+    return b"".join(read_item_packets(self, item, serial, status))
 
 
 def write_item_current_page_bytes(self, serial, item_Bytes: bytes,
@@ -638,10 +732,11 @@ def write_item_current_page_bytes(self, serial, item_Bytes: bytes,
     data_code = 0   # 0-write 2-read
     if packet_count == 0:
         return True
+    item_view = memoryview(item_Bytes)
     for i in range(0, packet_count):
         current_packet_bytes = get_send_packet_bytes(
                 item, i, data_code, packet_count,
-                item_Bytes[i * packet_len: (i + 1) * packet_len])
+                item_view[i * packet_len: (i + 1) * packet_len])
         flag, new_data_bytes = exchange_block_with_radio(
             current_packet_bytes,
             serial, self.read_packet_len)
@@ -652,13 +747,22 @@ def write_item_current_page_bytes(self, serial, item_Bytes: bytes,
         self.status_fn(status)
 
 
-def copy_to_memory(all_bytes: bytearray,
-                   item_bytes: bytes, start_addr: int, item_len: int):
+def read_item_into(self, item: int, serial, status, dest: memoryview):
     """
-    Put the given region bytes into the main memory array
+    Put the region bytes straight into dest (a view of the main memory
+    array) as packets arrive, returning the number of bytes received
     """
-    item_len = min(len(item_bytes), item_len)
-    all_bytes[start_addr:start_addr + item_len] = item_bytes[:item_len]
+    offset = 0
+    try:
+        for payload in read_item_packets(self, item, serial, status):
+            size = max(min(len(payload), len(dest) - offset), 0)
+            dest[offset:offset + size] = payload[:size]
+            offset += len(payload)
+    except Exception:
+        # Don't leave a half-written region behind
+        dest[:] = bytes(len(dest))
+        raise
+    return offset
 
 
 def exit_programming_mode(self):
@@ -684,16 +788,13 @@ def exit_programming_mode(self):
 
 def get_send_packet_bytes(data_type: int, packet_index: int,
                           data_code: int, packet_count: int,
-                          data_buffer: bytes):
-    data_len = len(data_buffer)
-    data_part = struct.pack(f'<12sHBBHH{data_len}s',
-                            b"RDTP\x01\x00\x00\x00\x00\x00\x00\x00",
-                            data_len + 6,
-                            data_type & 0xFF,
-                            data_code & 0xFF,  # 0-write 2-read
-                            packet_index & 0xFFFF,
-                            packet_count & 0xFFFF,
-                            data_buffer)
+                          data_buffer: bytes | memoryview):
+    data_part = _PACKET_HEADER.pack(_PACKET_MAGIC,
+                                    len(data_buffer) + 6,
+                                    data_type & 0xFF,
+                                    data_code & 0xFF,  # 0-write 2-read
+                                    packet_index & 0xFFFF,
+                                    packet_count & 0xFFFF) + data_buffer
     return data_part + calculate_crc16(data_part) + b"\xff"
 
 
@@ -726,7 +827,19 @@ def compare_version(a, b):
 
 
 def calculate_crc16(data):
-    return struct.pack('<H', checksum.crc16_ibm_rev(data))
+    return checksum.crc16_ibm_rev(data).to_bytes(2, 'little')
+
+
+def raw_to_dtcs(value):
+    """Read the octal digits of a raw DCS field as a decimal DTCS code"""
+    return ((value & 7) + ((value >> 3) & 7) * 10
+            + ((value >> 6) & 7) * 100 + ((value >> 9) & 7) * 1000)
+
+
+def dtcs_to_raw(code):
+    """Inverse of raw_to_dtcs: the octal value of a DTCS code's digits"""
+    return ((code % 10) + (code // 10 % 10) * 8
+            + (code // 100 % 10) * 64 + (code // 1000 % 10) * 512)
 
 
 def _get_memory(self, mem, _mem, ch_index):
@@ -736,7 +849,7 @@ def _get_memory(self, mem, _mem, ch_index):
             "tottime",
             "TOT",
             RadioSettingValueList(
-                get_namedict_by_items(TIMEOUTTIMER_LIST),
+                TIMEOUTTIMER_NAMES,
                 current_index=(_mem.tottime - 1))))
     mem.extra.append(
         RadioSetting(
@@ -789,8 +902,7 @@ def _get_memory(self, mem, _mem, ch_index):
     mem.extra.append(
         RadioSetting("scramble", "Scramble",
                      RadioSettingValueBoolean(_mem.scramble)))
-    ch_index_dict = get_ch_index(self)
-    if ch_index not in ch_index_dict:
+    if ch_index not in get_ch_index_set(self):
         mem.freq = 0
         mem.empty = True
         return mem
@@ -820,17 +932,13 @@ def _get_memory(self, mem, _mem, ch_index):
 
     rxtone = txtone = None
     if _mem.rxctcvaluetype == 1:
-        tone_value = _mem.rxctc / 10.0
-        if tone_value in chirp_common.TONES:
-            rxtone = tone_value
+        rxtone = RAW_CTC_TONES.get(int(_mem.rxctc))
     elif _mem.rxctcvaluetype in [2, 3]:
-        rxtone = int("%03o" % _mem.rxctc)
+        rxtone = raw_to_dtcs(int(_mem.rxctc))
     if _mem.txctcvaluetype == 1:
-        tone_value = _mem.txctc / 10.0
-        if tone_value in chirp_common.TONES:
-            txtone = tone_value
+        txtone = RAW_CTC_TONES.get(int(_mem.txctc))
     elif _mem.txctcvaluetype in [2, 3]:
-        txtone = int("%03o" % _mem.txctc)
+        txtone = raw_to_dtcs(int(_mem.txctc))
     rx_tone = (("" if _mem.rxctcvaluetype == 0
                 else "Tone" if _mem.rxctcvaluetype == 1 else "DTCS"),
                rxtone, (_mem.rxctcvaluetype == 0x3) and "R" or "N")
@@ -873,10 +981,9 @@ def get_common_setting(self, common):
         RadioSetting("settings.stunmode", "Stun Type",
                      RadioSettingValueList(opts,
                                            current_index=_settings.stunmode)))
-    opts_dict = [{"name": "%s" % (x + 1), "id": x} for x in range(0, 10, 1)]
     common.append(get_radiosetting_by_key(self, _settings,
                                           "calltone", "Call Tone",
-                                          _settings.calltone, opts_dict))
+                                          _settings.calltone, CALLTONE_LIST))
     common.append(
         get_radiosetting_by_key(
             self, _settings, "freqstep", "Frequency Step",
@@ -887,17 +994,14 @@ def get_common_setting(self, common):
             "settings.powersavingmode", "Battery Mode",
             RadioSettingValueList(
                 opts, current_index=_settings.powersavingmode)))
-    opts_dict = [
-        {"name": "%ss" % ((x + 1) * 5), "id": x} for x in range(0, 16, 1)]
     common.append(
         get_radiosetting_by_key(
             self, _settings, "powersavingdelaytime", "Battery Delay Time",
-            _settings.powersavingdelaytime, opts_dict))
-    opts_dict = [{"name": "%s" % x, "id": x} for x in range(1, 16, 1)]
+            _settings.powersavingdelaytime, POWERSAVINGDELAYTIME_LIST))
     common.append(
         get_radiosetting_by_key(
             self, _settings, "backlightbrightness", "Backlight Brightness",
-            _settings.backlightbrightness, opts_dict))
+            _settings.backlightbrightness, LEVEL_LIST))
 
     opts = [
         "Always", "5s", "10s", "15s", "20s", "25s", "30s",
@@ -907,24 +1011,18 @@ def get_common_setting(self, common):
         RadioSetting("settings.backlighttime", "Backlight Time",
                      RadioSettingValueList(
                          opts, current_index=_settings.backlighttime)))
-    opts_dict = [{"name": "%s" % x, "id": x} for x in range(1, 16, 1)]
     common.append(
         get_radiosetting_by_key(
             self, _settings, "voxthreshold", "VOX Level",
-            _settings.voxthreshold, opts_dict))
-    opts_dict = [
-        {"name": "%sms" % ((x) * 500), "id": x} for x in range(1, 5, 1)]
+            _settings.voxthreshold, LEVEL_LIST))
     common.append(
         get_radiosetting_by_key(
             self, _settings, "voxdelaytime", "VOX Delay Time",
-            _settings.voxdelaytime, opts_dict))
-    opts_dict = [{"name": "OFF", "id": 0}] + [
-        {"name": "%ss" % x, "id": x} for x in range(5, 256, 5)]
-
+            _settings.voxdelaytime, VOXDELAYTIME_LIST))
     common.append(
         get_radiosetting_by_key(
             self, _settings, "menuouttime", "Menu Timeout Setting",
-            _settings.menuouttime, opts_dict))
+            _settings.menuouttime, MENUOUTTIME_LIST))
     opts = ["Manual", "Auto"]
     common.append(
         RadioSetting(
@@ -936,16 +1034,15 @@ def get_common_setting(self, common):
         RadioSetting(
             "settings.chdisplay", "Display Mode",
             RadioSettingValueList(opts, current_index=_settings.chdisplay)))
-    opts = ["Band A", "Band B", "Band A & Band B", "Band B & Band A"]
     rs = RadioSetting(
         "settings.homeselect",
         "Band Selection",
         RadioSettingValueList(
-            opts,
+            BAND_SELECTION_LIST,
             current_index=get_band_selection(
                 _settings.homeselect, _settings.homeindex)))
     rs.set_apply_callback(
-        set_band_selection, _settings, opts, "homeselect", "homeindex")
+        set_band_selection, _settings, "homeselect", "homeindex")
     common.append(rs)
     opts = ["Channel", "VFO Frequency"]
     common.append(
@@ -1008,11 +1105,11 @@ def get_common_setting(self, common):
             RadioSettingValueList(
                 opts, current_index=_settings.tailsoundeliminationsfre)))
     if _settings.salezone != 2:
-        opts = ["NOAA-%s" % x for x in range(1, 13, 1)]
         common.append(
             RadioSetting(
                 "settings.wxch", "NOAA Channel",
-                RadioSettingValueList(opts, current_index=_settings.wxch)))
+                RadioSettingValueList(NOAA_CH_LIST,
+                                      current_index=_settings.wxch)))
     opts = ["1000Hz", "1450Hz", "1750Hz", "2100Hz"]
     common.append(
         RadioSetting(
@@ -1056,29 +1153,25 @@ def get_common_setting(self, common):
 
 def get_dtmf_setting(self, dtmf):
     _dtmf_comm = self._memobj.dtmfinfos.dtmfcomm
-    opts = ["OFF"] + ["%ss" % x for x in range(1, 16, 1)]
     dtmf.append(
         RadioSetting(
             "dtmfsetting.autoresettime",
             "Auto Reset Time",
-            RadioSettingValueList(opts,
+            RadioSettingValueList(AUTORESETTIME_LIST,
                                   current_index=_dtmf_comm.autoresettime)))
-    opts = [{"name": "Stun TX", "id": 1}, {"name": "Stun TX/RX", "id": 2}]
     dtmf.append(
         get_radiosetting_by_key(
             self, _dtmf_comm, "stunmode",
-            "Stun Type", _dtmf_comm.stunmode, opts))
-    opts = ["300ms", "550ms", "800ms", "1050ms"]
+            "Stun Type", _dtmf_comm.stunmode, DTMF_STUNMODE_LIST))
     dtmf.append(
         RadioSetting(
             "dtmfsetting.codedelaytime", "Digit Delay",
-            RadioSettingValueList(opts,
+            RadioSettingValueList(CODEDELAYTIME_LIST,
                                   current_index=_dtmf_comm.codedelaytime)))
-    opts = ["OFF", "BOT", "EOT", "Both"]
     dtmf.append(
         RadioSetting(
             "dtmfsetting.pttidtype", "PTT ID Type",
-            RadioSettingValueList(opts,
+            RadioSettingValueList(PTTIDTYPE_LIST,
                                   current_index=_dtmf_comm.pttidtype)))
     dtmf.append(
         RadioSetting(
@@ -1093,66 +1186,64 @@ def get_dtmf_setting(self, dtmf):
             "dtmfsetting.callid", "Call ID",
             RadioSettingValueString(
                 0, 10,
-                "".join(filter(_dtmf_comm.callid, DTMFCHARSET, 10, True)),
+                decode_field(_dtmf_comm.callid, DTMF_CHARS, 10, True),
                 False, DTMFCHARSET)))
     dtmf.append(
         RadioSetting(
             "dtmfsetting.stunid", "Stun ID",
             RadioSettingValueString(
                 0, 10,
-                "".join(filter(_dtmf_comm.stunid, DTMFCHARSET, 10, True)),
+                decode_field(_dtmf_comm.stunid, DTMF_CHARS, 10, True),
                 False, DTMFCHARSET)))
     dtmf.append(
         RadioSetting(
             "dtmfsetting.revive", "Revive ID",
             RadioSettingValueString(
                 0, 10,
-                "".join(filter(_dtmf_comm.revive, DTMFCHARSET, 10, True)),
+                decode_field(_dtmf_comm.revive, DTMF_CHARS, 10, True),
                 False, DTMFCHARSET)))
     dtmf.append(
         RadioSetting(
             "dtmfsetting.bot", "BOT",
             RadioSettingValueString(
                 0, 16,
-                "".join(filter(_dtmf_comm.bot, DTMFCHARSET, 16, True)),
+                decode_field(_dtmf_comm.bot, DTMF_CHARS, 16, True),
                 False, DTMFCHARSET)))
     dtmf.append(
         RadioSetting(
             "dtmfsetting.eot", "EOT",
             RadioSettingValueString(
                 0, 16,
-                "".join(filter(_dtmf_comm.eot, DTMFCHARSET, 16, True)),
+                decode_field(_dtmf_comm.eot, DTMF_CHARS, 16, True),
                 False, DTMFCHARSET)))
 
 
 def get_vfo_scan(self, vfoscan):
     _vfo_scan = self._memobj.vfoscans.vfoscans[0]
-    opts = ["Carrier", "Time", "Search"]
     vfoscan.append(
         RadioSetting(
             "vfoscan.scanmode", "Scan Mode",
-            RadioSettingValueList(opts, current_index=_vfo_scan.scanmode)))
-    opts = ["Carrier", "CTC/DCS"]
+            RadioSettingValueList(VFOSCANMODE_LIST,
+                                  current_index=_vfo_scan.scanmode)))
     vfoscan.append(
         RadioSetting(
             "vfoscan.scancondition", "Scan Condition",
-            RadioSettingValueList(opts,
+            RadioSettingValueList(SCANCONDITION_LIST,
                                   current_index=_vfo_scan.scancondition)))
 
-    opts = ["%s" % (x + 1) for x in range(0, 16, 1)]
     vfoscan.append(
         RadioSetting(
             "vfoscan.hangtime", "Scan Hang Time[s]",
-            RadioSettingValueList(opts, current_index=_vfo_scan.hangtime)))
+            RadioSettingValueList(HANGTIME_LIST,
+                                  current_index=_vfo_scan.hangtime)))
     vfoscan.append(
         RadioSetting(
             "vfoscan.talkback", "Talk Back Enable",
             RadioSettingValueBoolean(_vfo_scan.talkback)))
-    opts = ["Current Frequency", "Starting Frequency"]
     vfoscan.append(
         RadioSetting(
             "vfoscan.startcondition", "Start Condition",
-            RadioSettingValueList(opts,
+            RadioSettingValueList(STARTCONDITION_LIST,
                                   current_index=_vfo_scan.startcondition)))
 
     freq_start = from_MHz(_vfo_scan.vhffreq_start)
@@ -1169,30 +1260,37 @@ def get_vfo_scan(self, vfoscan):
 
 
 def _set_memory(self, mem, _mem, ch_index):
-    ch_index_dict = get_ch_index(self)
+    ch_index_set = get_ch_index_set(self)
+    if mem.empty and ch_index not in ch_index_set:
+        # Not in the channel index, so only the slot itself needs clearing
+        if _mem.get_raw() != EMPTY_CHANNEL:
+            _mem.set_raw(EMPTY_CHANNEL)
+        return
     rx_freq = get_ch_rxfreq(mem)
-    flag = ch_index not in ch_index_dict and rx_freq != 0
+    flag = ch_index not in ch_index_set and rx_freq != 0
     if rx_freq != 0xFFFFFFFF and flag:
-        ch_index_dict.append(ch_index)
-    elif ch_index in ch_index_dict and rx_freq <= 0:
-        ch_index_dict.remove(ch_index)
-        self.update_channel_indexes(ch_index, ch_index_dict)
-    set_ch_index(self, ch_index_dict)
-    _mem.set_raw(b"\x00" * 40)
+        update_ch_index(self, added=ch_index)
+    elif ch_index in ch_index_set and rx_freq <= 0:
+        update_ch_index(self, removed=ch_index)
+        self.update_channel_indexes(ch_index, get_ch_index(self))
+    else:
+        update_ch_index(self)
+    _mem.set_raw(EMPTY_CHANNEL)
     if mem.empty:
         return
     _mem.rxfreq = rx_freq
     _mem.alias = mem.name.ljust(14)
-    txfrq = (int(rx_freq - mem.offset)
-             if mem.duplex == "-" and mem.offset > 0
-             else (int(rx_freq + mem.offset)
-                   if mem.duplex == "+" and mem.offset > 0
-                   else rx_freq))
-    _mem.txfreq = txfrq
+    offset = mem.offset
+    if mem.duplex == "-" and offset > 0:
+        _mem.txfreq = int(rx_freq - offset)
+    elif mem.duplex == "+" and offset > 0:
+        _mem.txfreq = int(rx_freq + offset)
+    else:
+        _mem.txfreq = rx_freq
     _mem.bandwidth = 3 if mem.mode == "FM" else 1
-    if mem.power in POWER_LEVELS:
+    try:
         _mem.power = 2 if POWER_LEVELS.index(mem.power) == 1 else 0
-    else:
+    except ValueError:
         _mem.power = 0
     ((txmode, txtone, txpol),
      (rxmode, rxtone, rxpol)) = chirp_common.split_tone_encode(
@@ -1203,8 +1301,7 @@ def _set_memory(self, mem, _mem, ch_index):
         _mem.rxctc = rxtone_value
     elif rxmode == "DTCS":
         _mem.rxctcvaluetype = rxpol == "R" and 3 or 2
-        oct_value = int(str(rxtone), 8)
-        _mem.rxctc = oct_value
+        _mem.rxctc = dtcs_to_raw(rxtone)
     else:
         _mem.rxctcvaluetype = 0
     if txmode == "Tone":
@@ -1213,8 +1310,7 @@ def _set_memory(self, mem, _mem, ch_index):
         _mem.txctc = txtone_value
     elif txmode == "DTCS":
         _mem.txctcvaluetype = txpol == "R" and 3 or 2
-        oct_value = int(str(txtone), 8)
-        _mem.txctc = oct_value
+        _mem.txctc = dtcs_to_raw(txtone)
     else:
         _mem.txctcvaluetype = 0
     for setting in mem.extra:
@@ -1246,12 +1342,19 @@ def get_radiosetting_by_key(self, _setting, item_key,
     return item
 
 
+def get_opts_lookup(items):
+    """Names, id -> index and name -> id maps of an opts list"""
+    if isinstance(items, OptList):
+        return items.lookup
+    return build_opts_lookup(items)
+
+
 def get_namedict_by_items(items):
-    return [x["name"] for x in items]
+    return get_opts_lookup(items)[0]
 
 
 def get_item_by_id(items, value):
-    return next((i for i, item in enumerate(items) if item["id"] == value), 0)
+    return get_opts_lookup(items)[1].get(int(value), 0)
 
 
 def set_item_callback(set_item, obj, name, items):
@@ -1260,9 +1363,8 @@ def set_item_callback(set_item, obj, name, items):
 
 
 def get_item_by_name(items, name):
-    return next(
-        (item["id"] for item in items if item["name"] == name),
-        items[0]["id"] if items else 0)
+    return get_opts_lookup(items)[2].get(
+        str(name), items[0].id if items else 0)
 
 
 def get_band_selection(band_value, band_index):
@@ -1277,14 +1379,20 @@ def get_ch_index(self):
         ch_data = self._memobj.channeldata
         self._ch_cache = []
         seen = set()
-        for i in range(ch_data.chnum):
-            ch_index = int(ch_data.chindex[i])
+        for ch_index in get_ul16_array(self, ch_data.chindex, ch_data.chnum):
             if ch_index != 0xFFFF and ch_index not in seen:
                 seen.add(ch_index)
                 self._ch_cache.append(ch_index)
+        self._ch_cache_set = seen
     return self._ch_cache
 
 
+def get_ch_index_set(self):
+    """Same channel indexes as get_ch_index, for membership tests"""
+    get_ch_index(self)
+    return self._ch_cache_set
+
+
 def set_ch_index(self, ch_index_list):
     if not isinstance(ch_index_list, list):
         raise TypeError("ch_index must be a list")
@@ -1294,10 +1402,87 @@ def set_ch_index(self, ch_index_list):
     if len(_ch_data.chindex) < ch_num:
         raise ValueError("Not enough space in chindex array")
     _ch_data.chnum = ch_num
-    for i in range(len(_ch_data.chindex)):
-        _ch_data.chindex[i] = (
-            ch_index_list[i] if i < ch_num else 0xFFFF)
+    set_ul16_array(self, _ch_data.chindex, ch_index_list)
     self._ch_cache = ch_index_list.copy()
+    self._ch_cache_set = set(ch_index_list)
+    self._ch_index_synced = True
+
+
+def update_ch_index(self, added=None, removed=None):
+    """Add and/or remove one channel index, rewriting only the shifted tail"""
+    ch_index_list = get_ch_index(self)
+    if not self._ch_index_synced:
+        # The array may still hold duplicates or be unsorted from the
+        # image, so normalise it with a full rewrite once
+        if added is not None:
+            ch_index_list.append(added)
+        if removed is not None:
+            ch_index_list.remove(removed)
+        set_ch_index(self, ch_index_list)
+        return
+    _ch_data = self._memobj.channeldata
+    old_num = start = len(ch_index_list)
+    if removed is not None:
+        pos = bisect.bisect_left(ch_index_list, removed)
+        del ch_index_list[pos]
+        self._ch_cache_set.discard(removed)
+        start = pos
+    if added is not None:
+        if len(ch_index_list) >= len(_ch_data.chindex):
+            raise ValueError("Not enough space in chindex array")
+        pos = bisect.bisect_left(ch_index_list, added)
+        ch_index_list.insert(pos, added)
+        self._ch_cache_set.add(added)
+        start = min(start, pos)
+    ch_num = len(ch_index_list)
+    tail = ch_index_list[start:] + [0xFFFF] * max(old_num - ch_num, 0)
+    if tail:
+        offset = _ch_data.chindex.get_offset() + 2 * start
+        self._mmap[offset] = struct.pack("<%iH" % len(tail), *tail)
+        _ch_data.chnum = ch_num
+
+
+def set_ul16_array(self, array, values):
+    """Write values (0xFFFF padded) over a whole ul16 array in one go"""
+    count = len(array)
+    raw = struct.pack("<%iH" % count,
+                      *[int(x) for x in values],
+                      *[0xFFFF] * (count - len(values)))
+    self._mmap[array.get_offset()] = raw
+
+
+def get_ul16_array(self, array, count=None):
+    """Read a whole ul16 array (or its first count entries) in one go"""
+    count = len(array) if count is None else min(int(count), len(array))
+    raw = self._mmap.get(array.get_offset(), 2 * count)
+    return struct.unpack("<%iH" % count, raw)
+
+
+def set_char_array(self, array, value, pad="\x00"):
+    """Write a str (padded to size with pad) over a char array in one go"""
+    raw = value.ljust(len(array), pad).encode("latin-1")
+    if len(raw) != len(array):
+        raise ValueError("String expects exactly %i characters, not %i" % (
+            len(array), len(raw)))
+    self._mmap[array.get_offset()] = raw
+
+
+def remove_ul16_entry(self, array, pos, count):
+    """Drop array[pos] from the first count entries, 0xFFFF filling the end"""
+    if 0 <= pos < count <= len(array):
+        tail = get_ul16_array(self, array, count)[pos + 1:] + (0xFFFF,)
+        self._mmap[array.get_offset() + 2 * pos] = struct.pack(
+            "<%iH" % len(tail), *tail)
+    else:
+        array[count - 1] = 0xFFFF
+
+
+def find_ch_index(self, chindex, ch_index):
+    """Position of ch_index in a ul16 array, or None, in a single pass"""
+    try:
+        return get_ul16_array(self, chindex).index(ch_index)
+    except ValueError:
+        return None
 
 
 def get_ch_rxfreq(mem):
@@ -1316,24 +1501,38 @@ def get_ch_rxfreq(mem):
 
 
 def set_band_selection(set_item, obj,
-                       opts, home_select_field_name,
+                       home_select_field_name,
                        home_index_field_name):
-    value = opts.index(set_item.value)
-    value_mapping = {3: (1, 3), 2: (0, 3), 1: (1, 2), 0: (0, 1)}
-    home_index, home_select = value_mapping.get(value, (0, 1))
+    home_index, home_select = BAND_SELECTION_VALUES.get(
+        str(set_item.value), (0, 1))
     setattr(obj, home_index_field_name, home_index)
     setattr(obj, home_select_field_name, home_select)
 
 
+@functools.lru_cache(maxsize=None)
+def charset_filter_table(char_set, is_upper=False):
+    """bytes.translate() arguments that keep only the bytes in char_set"""
+    table = None
+    if is_upper:
+        table = bytes.maketrans(string.ascii_lowercase.encode(),
+                                string.ascii_uppercase.encode())
+    delete = bytes(b for b in range(256)
+                   if (chr(b).upper() if is_upper else chr(b)) not in char_set)
+    return table, delete
+
+
+def decode_field(field, char_set, max_length=10, is_upper=False):
+    """Like filter(), for a bitwise char array, working on its raw bytes"""
+    table, delete = charset_filter_table(char_set, is_upper)
+    raw = field.get_raw()[:max_length]
+    return raw.translate(table, delete).decode("ascii")
+
+
 def filter(s, char_set, max_length=10, is_upper=False):
-    s_ = ""
-    input_len = len(s)
-    for i in range(0, min(max_length, input_len)):
-        c = str(s[i])
-        if is_upper:
-            c = c.upper()
-        s_ += c if c in char_set else ""
-    return s_
+    """Keep only the characters of s in char_set; non-ASCII is dropped"""
+    table, delete = charset_filter_table(char_set, is_upper)
+    raw = str(s)[:max_length].encode("ascii", "ignore")
+    return raw.translate(table, delete).decode("ascii")
 
 
 def from_MHz(freq):
@@ -1353,8 +1552,11 @@ class HA1G(chirp_common.CloneModeRadio):
     current_model = "HA1G"
     _skip_vfoch_count = 3
     _ch_cache = None
-    _dtmf_list = [{"name": "OFF", "id": 15}]
-    _alarm_list = [{"name": "OFF", "id": 255}]
+    _ch_cache_set = None
+    _ch_index_synced = False
+    _zone_cache = None
+    _dtmf_list = OptList([Opt("OFF", 15)])
+    _alarm_list = OptList([Opt("OFF", 255)])
 
     # This is the minimum required firmare version supported by this driver
     REQUIRED_VER = "v1.1.11.6"
@@ -1387,9 +1589,13 @@ class HA1G(chirp_common.CloneModeRadio):
     _memsize = max(start + size for _, start,
                    size in MEMORY_REGIONS_RANGES.values())
 
+    @functools.cached_property
+    def _model_bytes(self):
+        return self.current_model.encode("ascii")
+
     def get_features(self):
         rf = chirp_common.RadioFeatures()
-        rf.valid_special_chans = sorted(SPECIAL_MEMORIES.keys())
+        rf.valid_special_chans = VALID_SPECIAL_CHANS
         rf.memory_bounds = (1, 256)  # Channel range
         rf.has_ctone = True
         rf.has_rx_dtcs = True
@@ -1403,22 +1609,13 @@ class HA1G(chirp_common.CloneModeRadio):
         rf.valid_name_length = 12
         rf.valid_skips = []
         rf.valid_tuning_steps = []
-        rf.valid_characters = chirp_common.CHARSET_UPPER_NUMERIC + "".join(
-            c for c in "-/;,._!? *#@$%&+=/<>~(){}]'"
-            if c not in chirp_common.CHARSET_UPPER_NUMERIC)
+        rf.valid_characters = VALID_CHARS
         rf.has_settings = True
         rf.valid_modes = MODES
         rf.valid_power_levels = POWER_LEVELS
         rf.has_comment = True
-        rf.valid_tmodes = ["", "Tone", "TSQL", "DTCS", "Cross"]
-        rf.valid_cross_modes = [
-            "Tone->Tone",
-            "Tone->DTCS",
-            "DTCS->Tone",
-            "->Tone",
-            "->DTCS",
-            "DTCS->",
-            "DTCS->DTCS"]
+        rf.valid_tmodes = VALID_TMODES
+        rf.valid_cross_modes = VALID_CROSS_MODES
         return rf
 
     def validate_memory(self, mem):
@@ -1443,8 +1640,16 @@ class HA1G(chirp_common.CloneModeRadio):
     def get_bank_model(self):
         return HA1GBankModel(self)
 
+    def _reset_caches(self):
+        """Forget the channel and bank caches derived from the last image"""
+        self._zone_cache = None
+        self._ch_cache = None
+        self._ch_cache_set = None
+        self._ch_index_synced = False
+
     def process_mmap(self):
         self._memobj = bitwise.parse(MEM_DEFINITIONS + MEM_FORMAT, self._mmap)
+        self._reset_caches()
         self._dtmf_list = self.get_dtmf_item_list()
         self._alarm_list = self.get_alarm_item_list()
 
@@ -1461,13 +1666,11 @@ class HA1G(chirp_common.CloneModeRadio):
     def sync_out(self):
         """Upload to radio"""
         try:
-            logging.debug("come in sync_out")
             do_upload(self)
         except errors.RadioError:
             raise
-        except Exception as e:
-            LOG.exception(
-                "Unexpected error during upload: %s" % e)
+        except Exception:
+            LOG.exception("Unexpected error during upload")
             raise errors.RadioError(
                 "Unexpected error communicating with the radio")
 
@@ -1477,18 +1680,18 @@ class HA1G(chirp_common.CloneModeRadio):
         status.msg = "Cloning from radio"
         status.cur = 0
         status.max = self._memsize
+        all_view = memoryview(all_bytes)
         items = self.MEMORY_REGIONS_RANGES.items()
         for item_name, (region_id, start_addr, length) in items:
             try:
-                item_bytes = get_read_current_packet_bytes(
-                    self, region_id, serial, status)
-                if item_name == "radioVer" and item_bytes:
-                    firmware_version = unpack_version(item_bytes[2:6])
+                received = read_item_into(
+                    self, region_id, serial, status,
+                    all_view[start_addr:start_addr + length])
+                if item_name == "radioVer" and received >= 6:
+                    firmware_version = unpack_version(
+                        all_bytes[start_addr + 2:start_addr + 6])
                     validate_version(self, firmware_version)
                     self.metadata = {'ha1g_firmware': firmware_version}
-                if item_bytes:
-                    copy_to_memory(all_bytes, item_bytes,
-                                   start_addr, length)
             except errors.RadioError:
                 raise
             except Exception as e:
@@ -1521,34 +1724,37 @@ class HA1G(chirp_common.CloneModeRadio):
 
     def get_memory(self, number):
         mem = chirp_common.Memory()
+        channels = self._memobj.channels
+        channel_count = len(channels)
         ch_index = 0
         if isinstance(number, str):
             mem.extd_number = number
             ch_index = 0 if number == "VFOA" else 1
-            mem.number = len(self._memobj.channels) + ch_index + 1
-        elif number > len(self._memobj.channels):
-            mem.extd_number = (
-                number - len(self._memobj.channels) == 1 and "VFOA" or "VFOB")
-            number = mem.extd_number
-            ch_index = 0 if number == "VFOA" else 1
+            mem.number = channel_count + ch_index + 1
+        elif number > channel_count:
+            if number - channel_count == 1:
+                mem.extd_number, ch_index = "VFOA", 0
+            else:
+                mem.extd_number, ch_index = "VFOB", 1
         else:
             ch_index = number + 2
             mem.number = number
-        _mem = self._memobj.channels[ch_index]
+        _mem = channels[ch_index]
         mem = _get_memory(self, mem, _mem, ch_index)
-        if ch_index > 2 and ch_index < 33:
-            mem.immutable = ["empty", "freq", "duplex", "offset"]
         if ch_index >= 10 and ch_index < 17:
-            mem.immutable += ["mode", "power"]
+            mem.immutable = list(FIXED_BAND_IMMUTABLE)
+        elif ch_index > 2 and ch_index < 33:
+            mem.immutable = list(FIXED_IMMUTABLE)
         return mem
 
     def set_memory(self, mem):
+        channels = self._memobj.channels
         ch_index = 0
-        if mem.number > len(self._memobj.channels):
+        if mem.number > len(channels):
             ch_index = 0 if mem.extd_number == "VFOA" else 1
         else:
             ch_index = mem.number + 2
-        _mem = self._memobj.channels[ch_index]
+        _mem = channels[ch_index]
         if ch_index < 33 and mem.freq == 0:
             return
         _set_memory(self, mem, _mem, ch_index)
@@ -1577,9 +1783,32 @@ class HA1G(chirp_common.CloneModeRadio):
         return setmode
 
     def set_settings(self, uisettings):
+        pending = {"settings": [], "dtmfsetting": [], "vfoscan": []}
+        self._prepare_settings(uisettings, pending)
+        # Apply the plain writes grouped by target, fetching each once
+        targets = (
+            ("settings", lambda: self._memobj.settings),
+            ("dtmfsetting", lambda: self._memobj.dtmfinfos.dtmfcomm),
+            ("vfoscan", lambda: self._memobj.vfoscans.vfoscans[0]))
+        for group, get_target in targets:
+            if not pending[group]:
+                continue
+            target = get_target()
+            for element_name, name, value in pending[group]:
+                try:
+                    if group == "dtmfsetting" and name in DTMF_CODE_LENGTHS:
+                        set_char_array(self, getattr(target, name), value)
+                    else:
+                        setattr(target, name, value)
+                    LOG.debug("Setting %s: %s", name, value)
+                except Exception:
+                    LOG.exception(element_name)
+                    raise
+
+    def _prepare_settings(self, uisettings, pending):
         for element in uisettings:
             if not isinstance(element, RadioSetting):
-                self.set_settings(element)
+                self._prepare_settings(element, pending)
                 continue
             if not element.changed():
                 continue
@@ -1587,61 +1816,55 @@ class HA1G(chirp_common.CloneModeRadio):
                 if element.has_apply_callback():
                     LOG.debug("Using apply callback")
                     element.run_apply_callback()
-                else:
-                    name = element.get_name()
-                    value = element.value
-                    if name.startswith("settings."):
-                        name = name[9:]
-                        _settings = self._memobj.settings
-                        setattr(_settings, name, value)
-                    elif name.startswith("dtmfsetting."):
-                        name = name[12:]
-                        _dtmfcomm = self._memobj.dtmfinfos.dtmfcomm
-                        if (name in ["callid", "stunid", "revive"]):
-                            value = filter(value, DTMFCHARSET, 10, True)
-                            value = value.ljust(10, "\x00")
-                        elif name in ["bot", "eot"]:
-                            value = filter(value, DTMFCHARSET, 16, True)
-                            value = value.ljust(16, "\x00")
-                        setattr(_dtmfcomm, name, value)
-                    elif name.startswith("vfoscan."):
-                        name = name[8:]
-                        _vfo_scan = self._memobj.vfoscans.vfoscans[0]
-                        if name in ["vhffreq_start", "vhffreq_end"]:
-                            value = chirp_common.to_MHz(value)
-                        setattr(_vfo_scan, name, value)
-                    LOG.debug("Setting %s: %s", name, value)
+                    continue
+                element_name = element.get_name()
+                group, _, name = element_name.partition(".")
+                if group not in pending:
+                    continue
+                value = element.value
+                if group == "dtmfsetting":
+                    length = DTMF_CODE_LENGTHS.get(name)
+                    if length:
+                        value = filter(value, DTMF_CHARS, length, True)
+                elif group == "vfoscan":
+                    if name in VFOSCAN_FREQ_FIELDS:
+                        value = chirp_common.to_MHz(value)
+                pending[group].append((element_name, name, value))
             except Exception:
                 LOG.exception(element.get_name())
                 raise
 
     def get_alarm_item_list(self):
         _alarmdata = self._memobj.alarms
-        alarm_list = [{"name": "OFF", "id": 255}]
+        alarm_list = [Opt("OFF", 255)]
         max_count = 8
         alarm_num = min(_alarmdata.alarmnum, max_count)
         if alarm_num > 0:
+            alarm_indexes = _alarmdata.alarmindex
+            alarm_items = _alarmdata.alarms
             for i in range(alarm_num):
-                alarm_index = min(_alarmdata.alarmindex[i], max_count - 1)
-                alarm_item = _alarmdata.alarms[alarm_index]
+                alarm_index = min(alarm_indexes[i], max_count - 1)
+                alarm_item = alarm_items[alarm_index]
                 alarm_item.alarmstatus = 1
-                alarmname = "".join(filter(alarm_item.name, NAMECHARSET, 12))
-                alarm_list.append({"name": alarmname, "id": alarm_index})
-        return alarm_list
+                alarmname = decode_field(alarm_item.name, NAME_CHARS, 12)
+                alarm_list.append(Opt(alarmname, alarm_index))
+        return OptList(alarm_list)
 
     def get_dtmf_item_list(self):
         _dtmfdata = self._memobj.dtmfinfos
-        dtmf_list = [{"name": "OFF", "id": 15}]
+        dtmf_list = [Opt("OFF", 15)]
         max_count = 4
         dtmf_num = min(_dtmfdata.dtmfnum, max_count)
         if dtmf_num > 0:
+            dtmf_indexes = _dtmfdata.dtmfindex
+            dtmf_items = _dtmfdata.dtmfs
             for i in range(dtmf_num):
-                dtmf_index = min(_dtmfdata.dtmfindex[i], max_count - 1)
-                dtmf_item = _dtmfdata.dtmfs[dtmf_index]
+                dtmf_index = min(dtmf_indexes[i], max_count - 1)
+                dtmf_item = dtmf_items[dtmf_index]
                 dtmf_item.dtmfstatus = 1
-                dtmfname = "".join(filter(dtmf_item.name, NAMECHARSET, 12))
-                dtmf_list.append({"name": dtmfname, "id": dtmf_index})
-        return dtmf_list
+                dtmfname = decode_field(dtmf_item.name, NAME_CHARS, 12)
+                dtmf_list.append(Opt(dtmfname, dtmf_index))
+        return OptList(dtmf_list)
 
     def get_scan_item_list(self):
         _scandata = self._memobj.scans
@@ -1649,11 +1872,13 @@ class HA1G(chirp_common.CloneModeRadio):
         max_count = 16
         scan_num = min(_scandata.scannum, max_count)
         if scan_num > 0:
+            scan_indexes = _scandata.scanindex
+            scan_items = _scandata.scans
             for i in range(0, scan_num):
-                scan_index = min(_scandata.scanindex[i], max_count)
-                scan_item = _scandata.scans[scan_index]
-                scanname = "".join(filter(scan_item.name, NAMECHARSET, 12))
-                scan_dict.append({"name": scanname, "id": scan_index})
+                scan_index = min(scan_indexes[i], max_count)
+                scan_item = scan_items[scan_index]
+                scanname = decode_field(scan_item.name, NAME_CHARS, 12)
+                scan_dict.append(Opt(scanname, scan_index))
         return scan_dict
 
     def supports_airband(self):
@@ -1684,28 +1909,33 @@ class HA1G(chirp_common.CloneModeRadio):
                 ch_index_list[self._skip_vfoch_count] if ch_index_list else 0)
 
     def update_zone_channel_index(self, ch_index):
+        self._zone_cache = None
         zones = self._memobj.zoneinfo
-        zonenum = min(len(zones.zoneindex), zones.zonenum)
+        zone_indexes = zones.zoneindex
+        zone_items = zones.zones
+        zonenum = min(len(zone_indexes), zones.zonenum)
         for i in range(zonenum):
-            idx = zones.zoneindex[i]
-            if idx == 0xFFFF or idx >= len(zones.zones):
+            idx = zone_indexes[i]
+            if idx == 0xFFFF or idx >= len(zone_items):
                 break
-            zone = zones.zones[idx]
-            if ch_index in zone.chindex:
-                chidx = zone.chindex.index(ch_index)
-                for j in range(chidx, zone.chnum-1):
-                    zone.chindex[j] = zone.chindex[j+1]
-                zone.chindex[zone.chnum - 1] = 0xFFFF
-                zone.chnum -= 1
+            zone = zone_items[idx]
+            chindex = zone.chindex
+            chidx = find_ch_index(self, chindex, ch_index)
+            if chidx is not None:
+                chnum = int(zone.chnum)
+                remove_ul16_entry(self, chindex, chidx, chnum)
+                zone.chnum = chnum - 1
 
     def update_scan_channel_index(self, ch_index, ch_index_list):
         scans = self._memobj.scans
-        scannum = min(len(scans.scanindex), scans.scannum)
+        scan_indexes = scans.scanindex
+        scan_items = scans.scans
+        scannum = min(len(scan_indexes), scans.scannum)
         for i in range(scannum):
-            idx = scans.scanindex[i]
-            if idx == 0xFFFF or idx >= len(scans.scans):
+            idx = scan_indexes[i]
+            if idx == 0xFFFF or idx >= len(scan_items):
                 break
-            scan = scans.scans[idx]
+            scan = scan_items[idx]
             if scan.specifych == ch_index:
                 scan.specifych = (
                     ch_index_list[self._skip_vfoch_count]
@@ -1714,21 +1944,23 @@ class HA1G(chirp_common.CloneModeRadio):
                 scan.PriorityCh1 = 0xFFFF
             if scan.PriorityCh2 == ch_index:
                 scan.PriorityCh2 = 0xFFFF
-            if ch_index in scan.chindex:
-                chidx = scan.chindex.index(ch_index)
-                for j in range(chidx, scan.chnum-1):
-                    scan.chindex[j] = scan.chindex[j+1]
-                scan.chindex[scan.chnum - 1] = 0xFFFF
-                scan.chnum -= 1
+            chindex = scan.chindex
+            chidx = find_ch_index(self, chindex, ch_index)
+            if chidx is not None:
+                chnum = int(scan.chnum)
+                remove_ul16_entry(self, chindex, chidx, chnum)
+                scan.chnum = chnum - 1
 
     def update_alarm_channel_index(self, ch_index):
         alarms = self._memobj.alarms
-        alarnum = min(len(alarms.alarmindex), alarms.alarmnum)
+        alarm_indexes = alarms.alarmindex
+        alarm_items = alarms.alarms
+        alarnum = min(len(alarm_indexes), alarms.alarmnum)
         for i in range(alarnum):
-            idx = alarms.alarmindex[i]
-            if idx == 0xFFFF or idx >= len(alarms.alarms):
+            idx = alarm_indexes[i]
+            if idx == 0xFFFF or idx >= len(alarm_items):
                 break
-            alarm = alarms.alarms[idx]
+            alarm = alarm_items[idx]
             if alarm.jumpch == ch_index:
                 alarm.jumpch = 0
 
@@ -1750,30 +1982,33 @@ class HA1UV(HA1G):
 
     def get_memory(self, number):
         mem = chirp_common.Memory()
+        channels = self._memobj.channels
+        channel_count = len(channels)
         ch_index = 0
         if isinstance(number, str):
             mem.extd_number = number
             ch_index = 0 if number == "VFOA" else 1
-            mem.number = len(self._memobj.channels) + ch_index + 1
-        elif number > len(self._memobj.channels):
-            mem.extd_number = (
-                number - len(self._memobj.channels) == 1 and "VFOA" or "VFOB")
-            number = mem.extd_number
-            ch_index = 0 if number == "VFOA" else 1
+            mem.number = channel_count + ch_index + 1
+        elif number > channel_count:
+            if number - channel_count == 1:
+                mem.extd_number, ch_index = "VFOA", 0
+            else:
+                mem.extd_number, ch_index = "VFOB", 1
         else:
             ch_index = number + 2
             mem.number = number
-        _mem = self._memobj.channels[ch_index]
+        _mem = channels[ch_index]
         return _get_memory(self, mem, _mem, ch_index)
 
     def set_memory(self, mem):
+        channels = self._memobj.channels
         ch_index = 0
-        if mem.number > len(self._memobj.channels):
+        if mem.number > len(channels):
             ch_index = 0 if mem.extd_number == "VFOA" else 1
         else:
             ch_index = mem.number + 2
-        _mem = self._memobj.channels[ch_index]
+        _mem = channels[ch_index]
         if ch_index < 2 and mem.freq == 0:
             return
         _set_memory(self, mem, _mem, ch_index)
-        LOG.debug("Setting %i(%s)" % (mem.number, mem.extd_number))
+        LOG.debug("Setting %i(%s)", mem.number, mem.extd_number)
@@ -294,36 +294,36 @@ struct {
 
 COMPANDER_LIST = ["OFF", "Tx/Rx", "Rx", "Tx"]
 
-SCRAMBLE_LIST = [
-    {"id": 255, "name": "Off"},
-    {"id": 0, "name": "2800"},
-    {"id": 1, "name": "2900"},
-    {"id": 2, "name": "3000"},
-    {"id": 3, "name": "3100"},
-    {"id": 4, "name": "3200"},
-    {"id": 5, "name": "3290"},
-    {"id": 6, "name": "3300"},
-    {"id": 7, "name": "3380"},
-    {"id": 8, "name": "3400"},
-    {"id": 9, "name": "3450"}
-]
-
-SIDE_KEY_LIST = [
-    {"name": "OFF", "id": 0},
-    {"name": "TX Power", "id": 1},
-    {"name": "Scan", "id": 2},
-    {"name": "FM Radio", "id": 3},
-    {"name": "Talkaround/Reversal", "id": 5},
-    {"name": "Monitor", "id": 15},
-    {"name": "Zone Plus", "id": 20},
-    {"name": "Zone Minus", "id": 21},
-    {"name": "Squelch", "id": 28},
-    {"name": "Emergency Start", "id": 29},
-    {"name": "Emergency Stop", "id": 30},
-    {"name": "Optional DTMF Code", "id": 32},
-    {"name": "Switch To QuickZone", "id": 35},
-    {"name": "Prog PTT", "id": 31}
-]
+SCRAMBLE_LIST = retevis_ha1g.OptList([
+    retevis_ha1g.Opt("Off", 255),
+    retevis_ha1g.Opt("2800", 0),
+    retevis_ha1g.Opt("2900", 1),
+    retevis_ha1g.Opt("3000", 2),
+    retevis_ha1g.Opt("3100", 3),
+    retevis_ha1g.Opt("3200", 4),
+    retevis_ha1g.Opt("3290", 5),
+    retevis_ha1g.Opt("3300", 6),
+    retevis_ha1g.Opt("3380", 7),
+    retevis_ha1g.Opt("3400", 8),
+    retevis_ha1g.Opt("3450", 9)
+])
+
+SIDE_KEY_LIST = retevis_ha1g.OptList([
+    retevis_ha1g.Opt("OFF", 0),
+    retevis_ha1g.Opt("TX Power", 1),
+    retevis_ha1g.Opt("Scan", 2),
+    retevis_ha1g.Opt("FM Radio", 3),
+    retevis_ha1g.Opt("Talkaround/Reversal", 5),
+    retevis_ha1g.Opt("Monitor", 15),
+    retevis_ha1g.Opt("Zone Plus", 20),
+    retevis_ha1g.Opt("Zone Minus", 21),
+    retevis_ha1g.Opt("Squelch", 28),
+    retevis_ha1g.Opt("Emergency Start", 29),
+    retevis_ha1g.Opt("Emergency Stop", 30),
+    retevis_ha1g.Opt("Optional DTMF Code", 32),
+    retevis_ha1g.Opt("Switch To QuickZone", 35),
+    retevis_ha1g.Opt("Prog PTT", 31)
+])
 
 DTMF_SIGNALINGLIST_DISABLED = 15
 TOTTIME_DISABLED = 36
@@ -541,7 +541,7 @@ def _get_common_setting(radio, common):
                      RadioSettingValueList(opts,
                                            current_index=_settings.stunmode)))
 
-    opts_dict = [{"name": "%s" % (x + 1), "id": x} for x in range(0, 10, 1)]
+    opts_dict = [retevis_ha1g.Opt("%s" % (x + 1), x) for x in range(0, 10, 1)]
     common.append(retevis_ha1g.get_radiosetting_by_key(
         radio, _settings, "calltone", "Call Tone",
         _settings.calltone, opts_dict))
@@ -562,13 +562,13 @@ def _get_common_setting(radio, common):
                 opts, current_index=_settings.powersavingmode)))
 
     opts_dict = [
-        {"name": "%ss" % ((x + 1) * 5), "id": x} for x in range(0, 16, 1)]
+        retevis_ha1g.Opt("%ss" % ((x + 1) * 5), x) for x in range(0, 16, 1)]
     common.append(
         retevis_ha1g.get_radiosetting_by_key(
             radio, _settings, "powersavingdelaytime", "Battery Delay Time",
             _settings.powersavingdelaytime, opts_dict))
 
-    opts_dict = [{"name": "%s" % x, "id": x} for x in range(1, 16, 1)]
+    opts_dict = [retevis_ha1g.Opt("%s" % x, x) for x in range(1, 16, 1)]
     common.append(
         retevis_ha1g.get_radiosetting_by_key(
             radio, _settings, "backlightbrightness", "Backlight Brightness",
@@ -583,21 +583,21 @@ def _get_common_setting(radio, common):
                      RadioSettingValueList(
                          opts, current_index=_settings.backlighttime)))
 
-    opts_dict = [{"name": "%s" % x, "id": x} for x in range(1, 16, 1)]
+    opts_dict = [retevis_ha1g.Opt("%s" % x, x) for x in range(1, 16, 1)]
     common.append(
         retevis_ha1g.get_radiosetting_by_key(
             radio, _settings, "voxthreshold", "VOX Level",
             _settings.voxthreshold, opts_dict))
 
     opts_dict = [
-        {"name": "%sms" % (x * 500), "id": x} for x in range(1, 5, 1)]
+        retevis_ha1g.Opt("%sms" % (x * 500), x) for x in range(1, 5, 1)]
     common.append(
         retevis_ha1g.get_radiosetting_by_key(
             radio, _settings, "voxdelaytime", "VOX Delay Time",
             _settings.voxdelaytime, opts_dict))
 
-    opts_dict = [{"name": "OFF", "id": 0}] + [
-        {"name": "%ss" % x, "id": x} for x in range(5, 256, 5)]
+    opts_dict = [retevis_ha1g.Opt("OFF", 0)] + [
+        retevis_ha1g.Opt("%ss" % x, x) for x in range(5, 256, 5)]
     common.append(
         retevis_ha1g.get_radiosetting_by_key(
             radio, _settings, "menuouttime", "Menu Timeout Setting",
@@ -616,16 +616,15 @@ def _get_common_setting(radio, common):
             "settings.chdisplay", "Display Mode",
             RadioSettingValueList(opts, current_index=_settings.chdisplay)))
 
-    opts = ["Band A", "Band B", "Band A & Band B", "Band B & Band A"]
     rs = RadioSetting(
         "settings.homeselect",
         "Band Selection",
         RadioSettingValueList(
-            opts,
+            retevis_ha1g.BAND_SELECTION_LIST,
             current_index=retevis_ha1g.get_band_selection(
                 _settings.homeselect, _settings.homeindex)))
     rs.set_apply_callback(
-        retevis_ha1g.set_band_selection, _settings, opts,
+        retevis_ha1g.set_band_selection, _settings,
         "homeselect", "homeindex")
     common.append(rs)
 
@@ -1166,6 +1165,7 @@ class HA2(retevis_ha1g.HA1G):
     def process_mmap(self):
         self._memobj = bitwise.parse(retevis_ha1g.MEM_DEFINITIONS + MEM_FORMAT,
                                      self._mmap)
+        self._reset_caches()
         self._dtmf_list = self.get_dtmf_item_list()
         self._alarm_list = self.get_alarm_item_list()
 
@@ -23,3 +23,21 @@ class TestCRC(unittest.TestCase):
         data = b"123456789"
         expected_checksum = 49  # Known XOR checksum for this data
         self.assertEqual(checksum.checksum_xor(data), expected_checksum)
+
+    def test_crc16_ibm_rev_matches_bitwise(self):
+        data = bytes(range(256)) * 4
+        self.assertEqual(
+            checksum.crc16_ibm_rev(data),
+            checksum.crc16(data, checksum.CRC_POLY_IBM_REV, reverse=True))
+        self.assertEqual(
+            checksum.crc16_ibm_rev(memoryview(data)[3:77]),
+            checksum.crc16(data[3:77], checksum.CRC_POLY_IBM_REV,
+                           reverse=True))
+
+    def test_crc16_ibm_rev_word_path(self):
+        for length in (63, 64, 65, 1047):
+            data = bytes((i * 7) & 0xFF for i in range(length))
+            self.assertEqual(
+                checksum.crc16_ibm_rev(data),
+                checksum.crc16(data, checksum.CRC_POLY_IBM_REV, reverse=True),
+                'Mismatch at length %i' % length)
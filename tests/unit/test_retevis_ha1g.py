@@ -0,0 +1,182 @@
+import os
+import struct
+import unittest
+from unittest import mock
+
+from chirp import bitwise
+from chirp import chirp_common
+from chirp import memmap
+from chirp.drivers import retevis_ha1g
+from chirp.drivers import retevis_ha2
+
+
+def baseline_filter(s, char_set, max_length=10, is_upper=False):
+    # The original per-character implementation, kept as a reference
+    s_ = ""
+    input_len = len(s)
+    for i in range(0, min(max_length, input_len)):
+        c = str(s[i])
+        if is_upper:
+            c = c.upper()
+        s_ += c if c in char_set else ""
+    return s_
+
+
+IMAGE = os.path.join(os.path.dirname(__file__), '..', 'images',
+                     'Retevis_HA1G.img')
+HA2_IMAGE = os.path.join(os.path.dirname(__file__), '..', 'images',
+                         'Retevis_HA2.img')
+
+
+class TestHA1GHelpers(unittest.TestCase):
+    def test_decode_field_matches_baseline(self):
+        raw = bytes(range(256))
+        charsets = ((retevis_ha1g.NAME_CHARS, retevis_ha1g.NAMECHARSET),
+                    (retevis_ha1g.DTMF_CHARS, retevis_ha1g.DTMFCHARSET))
+        for start in range(0, 256, 16):
+            obj = bitwise.parse('char name[16];',
+                                memmap.MemoryMapBytes(raw[start:start + 16]))
+            for chars, charset in charsets:
+                for is_upper in (False, True):
+                    expected = baseline_filter(obj.name, charset, 12,
+                                               is_upper)
+                    self.assertEqual(
+                        expected,
+                        retevis_ha1g.decode_field(obj.name, chars, 12,
+                                                  is_upper))
+                    self.assertEqual(
+                        expected,
+                        retevis_ha1g.filter(obj.name, chars, 12, is_upper))
+
+    def test_decode_field_fixed(self):
+        obj = bitwise.parse('char name[16];', memmap.MemoryMapBytes(
+            b'Ab1-\x00\xffz*#d\x01 \x7fQ?!'))
+        self.assertEqual('Ab1-z*#d ',
+                         retevis_ha1g.decode_field(
+                             obj.name, retevis_ha1g.NAME_CHARS, 12))
+        self.assertEqual('Ab1-z*#d ',
+                         retevis_ha1g.filter(
+                             obj.name, retevis_ha1g.NAME_CHARS, 12))
+        self.assertEqual('AB1*#D',
+                         retevis_ha1g.decode_field(
+                             obj.name, retevis_ha1g.DTMF_CHARS, 16, True))
+        self.assertEqual('1*#D',
+                         retevis_ha1g.filter(
+                             '1*#d!x', retevis_ha1g.DTMF_CHARS, 16, True))
+
+    def test_dtcs_raw_roundtrip(self):
+        for code in chirp_common.ALL_DTCS_CODES:
+            raw = retevis_ha1g.dtcs_to_raw(code)
+            self.assertEqual(int(str(code), 8), raw)
+            self.assertEqual(code, retevis_ha1g.raw_to_dtcs(raw))
+
+    def test_opts_lookup(self):
+        plain = [retevis_ha1g.Opt("A", 3), retevis_ha1g.Opt("B", 7)]
+        for items in (retevis_ha2.SCRAMBLE_LIST, retevis_ha2.SIDE_KEY_LIST,
+                      retevis_ha1g.SIDE_KEY_LIST, plain):
+            self.assertEqual([x.name for x in items],
+                             list(retevis_ha1g.get_namedict_by_items(items)))
+            for index, item in enumerate(items):
+                self.assertEqual(index,
+                                 retevis_ha1g.get_item_by_id(items, item.id))
+                self.assertEqual(item.id, retevis_ha1g.get_item_by_name(
+                    items, item.name))
+            self.assertEqual(0, retevis_ha1g.get_item_by_id(items, 254))
+            self.assertEqual(items[0].id,
+                             retevis_ha1g.get_item_by_name(items, "Nope"))
+        self.assertEqual(0, retevis_ha1g.get_item_by_name([], "Nope"))
+
+    def test_update_ch_index_matches_full_rewrite(self):
+        radio = retevis_ha1g.HA1G(IMAGE)
+        expected = list(retevis_ha1g.get_ch_index(radio))
+        ops = [(None, expected[5]), (600, None), (None, expected[0]),
+               (expected[0], expected[-1]), (3, None), (None, 600)]
+        for added, removed in ops:
+            retevis_ha1g.update_ch_index(radio, added=added, removed=removed)
+            if added is not None:
+                expected.append(added)
+            if removed is not None:
+                expected.remove(removed)
+            chindex = radio._memobj.channeldata.chindex
+            self.assertEqual(sorted(expected) + [0xFFFF] * (
+                len(chindex) - len(expected)), [int(x) for x in chindex])
+            self.assertEqual(len(expected),
+                             radio._memobj.channeldata.chnum)
+            self.assertEqual(sorted(expected),
+                             retevis_ha1g.get_ch_index(radio))
+
+    def test_remove_ul16_entry_matches_shift(self):
+        for pos, count in ((0, 4), (2, 4), (3, 4), (5, 4), (0, 0), (7, 8)):
+            radio = mock.MagicMock()
+            radio._mmap = memmap.MemoryMapBytes(
+                bytes(range(1, 9)) * 2)
+            obj = bitwise.parse('ul16 chindex[8];', radio._mmap)
+            expected = [int(x) for x in obj.chindex]
+            for j in range(pos, count - 1):
+                expected[j] = expected[j + 1]
+            expected[count - 1] = 0xFFFF
+            retevis_ha1g.remove_ul16_entry(radio, obj.chindex, pos, count)
+            self.assertEqual(expected, [int(x) for x in obj.chindex])
+
+    def test_read_item_into_clears_failed_region(self):
+        def packets(radio, item, serial, status):
+            yield memoryview(b'\x01\x02\x03')
+            raise struct.error('short reply')
+
+        dest = bytearray(b'\x00' * 8)
+        with mock.patch.object(retevis_ha1g, 'read_item_packets', packets):
+            self.assertRaises(struct.error, retevis_ha1g.read_item_into,
+                              None, 7, None, None, memoryview(dest)[2:6])
+        self.assertEqual(b'\x00' * 8, dest)
+
+    def test_set_memory_after_reload(self):
+        radio = retevis_ha1g.HA1G(IMAGE)
+        mem = radio.get_memory(48)
+        self.assertFalse(mem.empty)
+        mem.empty = True
+        radio.set_memory(mem)
+        self.assertTrue(radio.get_memory(48).empty)
+        radio.load_mmap(IMAGE)
+        mem = radio.get_memory(48)
+        self.assertFalse(mem.empty)
+        chnum = int(radio._memobj.channeldata.chnum)
+        self.assertEqual(chnum, len(retevis_ha1g.get_ch_index(radio)))
+        mem = radio.get_memory(49)
+        mem.empty = True
+        radio.set_memory(mem)
+        self.assertFalse(radio.get_memory(48).empty)
+        self.assertTrue(radio.get_memory(49).empty)
+        self.assertEqual(chnum - 1, radio._memobj.channeldata.chnum)
+
+    def test_ha2_roundtrip(self):
+        radio = retevis_ha2.HA2(HA2_IMAGE)
+        for number, freq in ((1, 144975000), (3, 430375000)):
+            mem = radio.get_memory(number)
+            self.assertFalse(mem.empty)
+            self.assertEqual(freq, mem.freq)
+            self.assertEqual('CH-%i' % number, mem.name)
+        self.assertTrue(radio.get_memory(5).empty)
+
+        _settings = radio._memobj.settings
+        for value, expected in retevis_ha1g.BAND_SELECTION_VALUES.items():
+            settings = radio.get_settings()
+            for element in settings.walk():
+                if element.get_name() == 'settings.homeselect':
+                    element.value = value
+            radio.set_settings(settings)
+            self.assertEqual(expected, (int(_settings.homeindex),
+                                        int(_settings.homeselect)))
+
+        bank_model = radio.get_bank_model()
+        mem = radio.get_memory(2)
+        zones = bank_model.get_memory_mappings(mem)
+        self.assertIn('Zone-1', [zone.get_name() for zone in zones])
+        zone = [x for x in zones if x.get_name() == 'Zone-1'][0]
+        bank_model.remove_memory_from_mapping(mem, zone)
+        self.assertNotIn(2, [x.number for x in
+                             bank_model.get_mapping_memories(zone)])
+        radio.load_mmap(HA2_IMAGE)
+        self.assertEqual(
+            [zone.get_name() for zone in zones],
+            [x.get_name() for x in bank_model.get_memory_mappings(
+                radio.get_memory(2))])